@@ -1,21 +1,33 @@
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 LOGGER = logging.getLogger("realtor_agents_scraper.data_cleaner")
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+_NON_PHONE_RE = re.compile(r"[^\d+]+")
+_FLOAT_CHARS_RE = re.compile(r"[^\d.]+")
+_WS_RE = re.compile(r"\s+")
+# Matches anything _norm_ws would change: leading/trailing whitespace, runs
+# of whitespace, or whitespace other than a plain space.
+_WS_DIRTY_RE = re.compile(r"^\s|\s$|\s\s|[^\S ]")
+
+def _norm_ws(value: Any) -> str:
+    # Collapse whitespace runs to single spaces without building a token list.
+    # Text from our own parser is usually normalized already, in which case a
+    # read-only scan is enough and the string is returned as is.
+    text = str(value)
+    if _WS_DIRTY_RE.search(text) is None:
+        return text
+    return _WS_RE.sub(" ", text).strip()
+
 def _clean_phone(phone: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     number = str(phone.get("number", "")).strip()
     if not number:
         return None
 
     # Normalize common phone patterns a bit
-    cleaned = []
-    for ch in number:
-        if ch.isdigit():
-            cleaned.append(ch)
-        elif ch in ("+",):
-            cleaned.append(ch)
-    normalized_number = "".join(cleaned) or number
+    normalized_number = _NON_PHONE_RE.sub("", number) or number
 
     phone_type = phone.get("type") or None
     if isinstance(phone_type, str):
@@ -28,14 +40,14 @@ def _clean_phone(phone: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         result["ext"] = str(phone["ext"]).strip()
     return result
 
-def _dedupe_list(items: List[Any]) -> List[Any]:
+def _dedupe_phones(phones: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     seen = set()
     result = []
-    for item in items:
-        key = repr(item)
+    for phone in phones:
+        key = (phone["number"], phone.get("type"), phone.get("ext"))
         if key not in seen:
             seen.add(key)
-            result.append(item)
+            result.append(phone)
     return result
 
 def _to_int(value: Any) -> Optional[int]:
@@ -45,7 +57,10 @@ def _to_int(value: Any) -> Optional[int]:
         return value
     try:
         text = str(value)
-        digits = "".join(ch for ch in text if ch.isdigit())
+        # Already-numeric strings ("2016", "50") skip the regex pass entirely
+        if text.isdecimal():
+            return int(text)
+        digits = _NON_DIGIT_RE.sub("", text)
         return int(digits) if digits else None
     except Exception:
         return None
@@ -56,16 +71,11 @@ def _to_float(value: Any) -> Optional[float]:
     if isinstance(value, (float, int)):
         return float(value)
     try:
-        text = str(value).strip().replace(",", ".")
-        parts = []
-        dot_seen = False
-        for ch in text:
-            if ch.isdigit():
-                parts.append(ch)
-            elif ch == "." and not dot_seen:
-                parts.append(ch)
-                dot_seen = True
-        return float("".join(parts)) if parts else None
+        text = _FLOAT_CHARS_RE.sub("", str(value).replace(",", "."))
+        # Only the first dot is kept as the decimal separator
+        head, dot, tail = text.partition(".")
+        text = head + dot + tail.replace(".", "")
+        return float(text) if text and text != "." else None
     except Exception:
         return None
 
@@ -76,7 +86,7 @@ def _clean_office(office: Dict[str, Any]) -> Dict[str, Any]:
     if "website" in office and office["website"]:
         cleaned["website"] = str(office["website"]).strip()
     if "raw_address" in office and office["raw_address"]:
-        cleaned["address"] = {"raw": " ".join(str(office["raw_address"]).split())}
+        cleaned["address"] = {"raw": _norm_ws(office["raw_address"])}
     if "address" in office and isinstance(office["address"], dict):
         cleaned["address"] = office["address"]
     return cleaned
@@ -85,32 +95,36 @@ def _clean_address(address: Dict[str, Any]) -> Dict[str, Any]:
     cleaned: Dict[str, Any] = {}
     for key in ("line", "city", "state", "postal_code", "raw"):
         if key in address and address[key]:
-            cleaned[key] = " ".join(str(address[key]).split())
+            cleaned[key] = _norm_ws(address[key])
     return cleaned
 
 def clean_agent_record(agent: Dict[str, Any]) -> Dict[str, Any]:
     cleaned: Dict[str, Any] = {}
+    # Each field is looked up once and bound locally; the isinstance checks
+    # below then work on that value instead of re-indexing the record.
+    get = agent.get
 
     # Simple scalar fields
     for field in ("description", "experience", "web_url", "title", "photo", "advertiser_id"):
-        if field in agent and agent[field]:
-            cleaned[field] = " ".join(str(agent[field]).split())
+        value = get(field)
+        if value:
+            cleaned[field] = _norm_ws(value)
 
     # Numeric conversions
-    first_year = _to_int(agent.get("first_year"))
+    first_year = _to_int(get("first_year"))
     if first_year:
         cleaned["first_year"] = first_year
 
-    review_count = _to_int(agent.get("review_count"))
+    review_count = _to_int(get("review_count"))
     if review_count is not None:
         cleaned["review_count"] = review_count
 
-    rating = _to_float(agent.get("agent_rating"))
+    rating = _to_float(get("agent_rating"))
     if rating is not None:
         cleaned["agent_rating"] = rating
 
     # Phones
-    raw_phones = agent.get("phones") or []
+    raw_phones = get("phones") or []
     phones: List[Dict[str, Any]] = []
     if isinstance(raw_phones, list):
         for raw in raw_phones:
@@ -120,64 +134,70 @@ def clean_agent_record(agent: Dict[str, Any]) -> Dict[str, Any]:
             if cleaned_phone:
                 phones.append(cleaned_phone)
     if phones:
-        cleaned["phones"] = _dedupe_list(phones)
+        cleaned["phones"] = _dedupe_phones(phones)
 
     # Address
-    if isinstance(agent.get("address"), dict):
-        addr = _clean_address(agent["address"])
+    raw_address = get("address")
+    if isinstance(raw_address, dict):
+        addr = _clean_address(raw_address)
         if addr:
             cleaned["address"] = addr
 
     # Office
-    if isinstance(agent.get("office"), dict):
-        office = _clean_office(agent["office"])
+    raw_office = get("office")
+    if isinstance(raw_office, dict):
+        office = _clean_office(raw_office)
         if office:
             cleaned["office"] = office
 
     # Lists
-    specs = agent.get("specializations") or []
+    specs = get("specializations") or []
     if isinstance(specs, list):
         cleaned_specs = [str(s).strip() for s in specs if s]
         if cleaned_specs:
-            cleaned["specializations"] = _dedupe_list(cleaned_specs)
+            cleaned["specializations"] = list(dict.fromkeys(cleaned_specs))
 
     # Broker
-    if isinstance(agent.get("broker"), dict):
+    raw_broker = get("broker")
+    if isinstance(raw_broker, dict):
         broker_cleaned = {
-            k: " ".join(str(v).split())
-            for k, v in agent["broker"].items()
+            k: _norm_ws(v)
+            for k, v in raw_broker.items()
             if v
         }
         if broker_cleaned:
             cleaned["broker"] = broker_cleaned
 
     # Activity blocks (keep structure but normalize numeric values where obvious)
-    if isinstance(agent.get("recently_sold"), dict):
-        rs = agent["recently_sold"].copy()
+    recently_sold = get("recently_sold")
+    if isinstance(recently_sold, dict):
+        rs = recently_sold.copy()
         if "count" in rs:
             rs["count"] = _to_int(rs["count"])
         cleaned["recently_sold"] = rs
 
-    if isinstance(agent.get("for_sale_price"), dict):
-        fs = agent["for_sale_price"].copy()
+    for_sale_price = get("for_sale_price")
+    if isinstance(for_sale_price, dict):
+        fs = for_sale_price.copy()
         for key in ("min", "max", "count"):
             if key in fs:
                 fs[key] = _to_int(fs[key])
         cleaned["for_sale_price"] = fs
 
     # Reviews (truncate very long comments to avoid bloating exports)
-    if isinstance(agent.get("reviews"), list):
+    raw_reviews = get("reviews")
+    if isinstance(raw_reviews, list):
         cleaned_reviews = []
-        for review in agent["reviews"]:
+        for review in raw_reviews:
             if not isinstance(review, dict):
                 continue
             r: Dict[str, Any] = {}
-            if "rating" in review:
-                r_val = _to_float(review["rating"])
-                if r_val is not None:
-                    r["rating"] = r_val
-            if "comment" in review and review["comment"]:
-                text = str(review["comment"]).strip()
+            r_val = _to_float(review.get("rating"))
+            if r_val is not None:
+                r["rating"] = r_val
+            comment = review.get("comment")
+            if comment:
+                text = str(comment).strip()
                 if len(text) > 2000:
                     text = text[:2000] + "..."
                 r["comment"] = text
@@ -187,25 +207,28 @@ def clean_agent_record(agent: Dict[str, Any]) -> Dict[str, Any]:
             cleaned["reviews"] = cleaned_reviews
 
     # Recommendations (kept mostly as-is)
-    if isinstance(agent.get("recommendations"), list):
-        recs = []
-        for rec in agent["recommendations"]:
-            if isinstance(rec, dict):
-                recs.append(rec)
+    raw_recs = get("recommendations")
+    if isinstance(raw_recs, list):
+        recs = [rec for rec in raw_recs if isinstance(rec, dict)]
         if recs:
             cleaned["recommendations"] = recs
 
     return cleaned
 
-def clean_agents(agents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    cleaned_list: List[Dict[str, Any]] = []
+def iter_cleaned_agents(agents: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    # Checked once per run rather than inside LOGGER.debug for every record
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
     for idx, agent in enumerate(agents):
         if not isinstance(agent, dict):
-            LOGGER.debug("Skipping non-dict agent at index %d", idx)
+            if debug:
+                LOGGER.debug("Skipping non-dict agent at index %d", idx)
             continue
         cleaned = clean_agent_record(agent)
         if not cleaned:
-            LOGGER.debug("Skipping empty cleaned agent at index %d", idx)
+            if debug:
+                LOGGER.debug("Skipping empty cleaned agent at index %d", idx)
             continue
-        cleaned_list.append(cleaned)
-    return cleaned_list
\ No newline at end of file
+        yield cleaned
+
+def clean_agents(agents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list(iter_cleaned_agents(agents))
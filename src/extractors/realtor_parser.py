@@ -1,15 +1,19 @@
 import logging
-import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOGGER = logging.getLogger("realtor_agents_scraper.realtor_parser")
 
-@dataclass
+@dataclass(slots=True)
 class AgentProfile:
     first_year: Optional[int] = None
     description: Optional[str] = None
@@ -30,12 +34,64 @@ class AgentProfile:
     title: Optional[str] = None
     photo: Optional[str] = None
 
+# CSS selectors are compiled once at import time rather than re-parsed on
+# every select()/select_one() call for each scraped page.
+_SEL_NAME = sv.compile("h1, h1[data-testid='profile-name']")
+_SEL_DESCRIPTION = sv.compile("[data-testid='agent-description'], .agent-description, .bio")
+_SEL_PHOTO = sv.compile("img[src*='ap.rdcpix.com'], img[alt*='agent photo']")
+_SEL_PHONES = sv.compile("[data-testid='phone'], .agent-phone, a[href^='tel:']")
+_SEL_OFFICE = sv.compile("[data-testid='office-info'], .office-info, .brokerage")
+_SEL_ADDRESS = sv.compile("[data-testid='address'], .agent-address, address")
+_SEL_RATING = sv.compile("[data-testid='rating'], .rating-value, .review-rating")
+_SEL_SPECIALTIES = sv.compile("[data-testid='specialties'] li, .specialties li")
+_SEL_REVIEWS = sv.compile("[data-testid='review'], .review-card")
+_SEL_REVIEW_RATING = sv.compile(".rating, [data-testid='rating']")
+_SEL_REVIEW_COMMENT = sv.compile("p, .comment, .review-text")
+_SEL_AGENT_LINKS = sv.compile("a[href*='realestateagents'], a[href*='/agents/']")
+
+# Listing pages only contribute links, so only anchors are materialized
+_LISTING_STRAINER = SoupStrainer("a", href=True)
+
+_AGENT_URL_RE = re.compile(r"realestateagents|/agents/", re.IGNORECASE)
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Text markers located with a single pass over the page's strings:
+# (marker name, substring, match case-insensitively)
+_TEXT_MARKERS: Tuple[Tuple[str, str, bool], ...] = (
+    ("experience", "Years in Business", False),
+    ("review_count", "review", True),
+    ("recently_sold", "recently sold", True),
+    ("for_sale", "for sale", True),
+)
+
+_PROFILE_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(AgentProfile))
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/124.0 Safari/537.36"
 )
 
+def _normalize_url(url: str) -> str:
+    # Canonical form used to dedupe profile URLs: lowercase scheme/host,
+    # no fragment and no trailing slash on the path.
+    parsed = urlparse(url.strip())
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(
+        (parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.params, parsed.query, "")
+    )
+
+def _make_soup(resp: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    # A charset declared in Content-Type lets bs4 decode directly instead of
+    # sniffing the raw bytes for an encoding first.
+    match = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    return BeautifulSoup(
+        resp.content,
+        "lxml",
+        parse_only=parse_only,
+        from_encoding=match.group(1) if match else None,
+    )
+
 class RealtorAgentScraper:
     def __init__(
         self,
@@ -45,6 +101,9 @@ class RealtorAgentScraper:
         timeout: int = 15,
         max_retries: int = 3,
         backoff_factor: float = 0.8,
+        workers: int = 16,
+        cache_path: Optional[str] = None,
+        cache_expire_after: int = 3600,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.full_agent_details = full_agent_details
@@ -52,7 +111,28 @@ class RealtorAgentScraper:
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
-        self.session = requests.Session()
+        self.workers = max(1, workers)
+        self.session = self._create_session(cache_path, cache_expire_after)
+        # Retries happen inside urllib3's connection pool: jittered
+        # exponential backoff, Retry-After honored on 429/503. The pool is
+        # sized to the worker count so concurrent profile fetches reuse
+        # keep-alive connections instead of discarding them.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.workers,
+            pool_maxsize=self.workers,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": USER_AGENT,
@@ -61,14 +141,56 @@ class RealtorAgentScraper:
             }
         )
 
+    @staticmethod
+    def _create_session(cache_path: Optional[str], expire_after: int) -> requests.Session:
+        if not cache_path:
+            return requests.Session()
+
+        try:
+            import requests_cache  # type: ignore
+        except ImportError:
+            LOGGER.warning(
+                "requests-cache is not installed; continuing without the HTTP cache. "
+                "Install it with 'pip install requests-cache' to enable it."
+            )
+            return requests.Session()
+
+        LOGGER.info("Using HTTP response cache at %s", cache_path)
+        return requests_cache.CachedSession(
+            cache_path,
+            expire_after=expire_after,
+            allowable_codes=(200,),
+        )
+
     # ------------- Public API -------------
 
+    def iter_agents(self, urls: Iterable[str], limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        profile_urls = self._collect_profile_urls(urls, limit=limit)
+        if not profile_urls:
+            return
+
+        LOGGER.info(
+            "Scraping %d agent profiles with %d workers", len(profile_urls), self.workers
+        )
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for agent in executor.map(self._scrape_agent_profile, profile_urls):
+                if agent:
+                    yield agent
+
     def scrape_from_urls(self, urls: Iterable[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        all_agents: List[Dict[str, Any]] = []
-        count = 0
+        return list(self.iter_agents(urls, limit=limit))
+
+    # ------------- Core scraping logic -------------
+
+    def _collect_profile_urls(self, urls: Iterable[str], limit: Optional[int]) -> List[str]:
+        # Listing pages are expanded into agent profile URLs up front so that
+        # the profiles themselves can be fetched concurrently. Duplicates are
+        # dropped on the normalized URL, but the first original URL is what
+        # gets fetched and recorded.
+        profile_urls: Dict[str, str] = {}
 
         for url in urls:
-            if limit is not None and count >= limit:
+            if limit is not None and len(profile_urls) >= limit:
                 break
 
             url = url.strip()
@@ -77,88 +199,69 @@ class RealtorAgentScraper:
 
             LOGGER.info("Processing URL: %s", url)
             if self._looks_like_agent_profile(url):
-                agent = self._scrape_agent_profile(url)
-                if agent:
-                    all_agents.append(agent)
-                    count += 1
+                profile_urls.setdefault(_normalize_url(url), url)
             else:
-                agents_from_listing = self._scrape_listing(url, limit=limit, current_count=count)
-                all_agents.extend(agents_from_listing)
-                count = len(all_agents)
-                if limit is not None and count >= limit:
-                    break
-
-        return all_agents
+                for agent_url in self._scrape_listing(url):
+                    profile_urls.setdefault(_normalize_url(agent_url), agent_url)
 
-    # ------------- Core scraping logic -------------
+        collected = list(profile_urls.values())
+        if limit is not None:
+            collected = collected[:limit]
+        return collected
 
     def _get_with_retries(self, url: str) -> Optional[requests.Response]:
-        last_exc: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                LOGGER.debug("GET %s (attempt %d)", url, attempt)
-                resp = self.session.get(url, timeout=self.timeout)
-                if resp.status_code >= 400:
-                    LOGGER.warning("Received HTTP %s for %s", resp.status_code, url)
-                else:
-                    return resp
-            except Exception as exc:
-                last_exc = exc
-                LOGGER.warning("Request error for %s: %s", url, exc)
-
-            sleep_time = self.backoff_factor * attempt
-            LOGGER.debug("Sleeping %.2fs before retry", sleep_time)
-            time.sleep(sleep_time)
-
-        LOGGER.error("Failed to fetch %s after %d attempts: %s", url, self.max_retries, last_exc)
-        return None
-
-    def _scrape_listing(
-        self,
-        url: str,
-        limit: Optional[int],
-        current_count: int,
-    ) -> List[Dict[str, Any]]:
+        # Retries and backoff are handled by the Retry policy on the adapter
+        try:
+            LOGGER.debug("GET %s", url)
+            resp = self.session.get(url, timeout=self.timeout)
+        except Exception as exc:
+            LOGGER.error("Failed to fetch %s after %d retries: %s", url, self.max_retries, exc)
+            return None
+
+        if resp.status_code >= 400:
+            LOGGER.warning("Received HTTP %s for %s", resp.status_code, url)
+            return None
+        return resp
+
+    def _scrape_listing(self, url: str) -> List[str]:
         resp = self._get_with_retries(url)
         if resp is None:
             return []
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        soup = _make_soup(resp, parse_only=_LISTING_STRAINER)
         agent_links = self._extract_agent_links_from_listing(soup)
         LOGGER.info("Found %d potential agent links on listing page", len(agent_links))
-
-        agents: List[Dict[str, Any]] = []
-        for agent_url in agent_links:
-            if limit is not None and current_count + len(agents) >= limit:
-                break
-            agent_data = self._scrape_agent_profile(agent_url)
-            if agent_data:
-                agents.append(agent_data)
-
-        return agents
+        return agent_links
 
     def _scrape_agent_profile(self, url: str) -> Optional[Dict[str, Any]]:
         resp = self._get_with_retries(url)
         if resp is None:
             return None
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        soup = _make_soup(resp)
 
         profile = AgentProfile()
         profile.web_url = url
 
         try:
-            self._parse_basic_info(soup, profile)
+            markers = self._scan_text_markers(soup)
+            self._parse_basic_info(soup, profile, markers)
             self._parse_office_and_address(soup, profile)
-            self._parse_reviews_and_ratings(soup, profile)
-            self._parse_activity_blocks(soup, profile)
+            self._parse_reviews_and_ratings(soup, profile, markers)
+            self._parse_activity_blocks(soup, profile, markers)
 
             if self.full_agent_details:
                 self._parse_detailed_sections(soup, profile)
         except Exception as exc:
             LOGGER.warning("Error parsing agent profile %s: %s", url, exc, exc_info=False)
 
-        data = {k: v for k, v in asdict(profile).items() if v not in (None, [], {})}
+        # Shallow projection: asdict() would deep-copy every review/phone list
+        # only for the empty values to be dropped right after.
+        data = {}
+        for name in _PROFILE_FIELDS:
+            value = getattr(profile, name)
+            if value not in (None, [], {}):
+                data[name] = value
         if not data:
             LOGGER.warning("Parsed empty agent profile from %s", url)
             return None
@@ -167,24 +270,49 @@ class RealtorAgentScraper:
 
     # ------------- HTML parsing helpers -------------
 
-    def _parse_basic_info(self, soup: BeautifulSoup, profile: AgentProfile) -> None:
+    def _scan_text_markers(self, soup: BeautifulSoup) -> Dict[str, NavigableString]:
+        # One walk over the document finds the first string matching each
+        # marker, stopping as soon as all of them have been seen.
+        found: Dict[str, NavigableString] = {}
+        pending = list(_TEXT_MARKERS)
+        for node in soup.descendants:
+            if not isinstance(node, NavigableString):
+                continue
+            lowered = node.lower()
+            hit = False
+            for name, needle, fold in pending:
+                if needle in (lowered if fold else node):
+                    found[name] = node
+                    hit = True
+            if hit:
+                pending = [marker for marker in pending if marker[0] not in found]
+                if not pending:
+                    break
+        return found
+
+    def _parse_basic_info(
+        self,
+        soup: BeautifulSoup,
+        profile: AgentProfile,
+        markers: Dict[str, NavigableString],
+    ) -> None:
         # Name / title
-        name_el = soup.select_one("h1, h1[data-testid='profile-name']")
+        name_el = _SEL_NAME.select_one(soup)
         if name_el:
             profile.title = name_el.get_text(strip=True)
 
         # Description / bio
-        desc_el = soup.select_one("[data-testid='agent-description'], .agent-description, .bio")
+        desc_el = _SEL_DESCRIPTION.select_one(soup)
         if desc_el:
             profile.description = " ".join(desc_el.get_text(" ", strip=True).split())
 
         # Photo
-        photo_el = soup.select_one("img[src*='ap.rdcpix.com'], img[alt*='agent photo']")
+        photo_el = _SEL_PHOTO.select_one(soup)
         if photo_el and photo_el.get("src"):
             profile.photo = photo_el["src"]
 
         # First year / experience
-        exp_el = soup.find(string=lambda s: isinstance(s, str) and "Years in Business" in s)
+        exp_el = markers.get("experience")
         if exp_el and exp_el.parent:
             # Very rough heuristic around content structure
             parent_text = exp_el.parent.get_text(" ", strip=True)
@@ -192,7 +320,7 @@ class RealtorAgentScraper:
 
         # Phones
         phones: List[Dict[str, Any]] = []
-        for node in soup.select("[data-testid='phone'], .agent-phone, a[href^='tel:']"):
+        for node in _SEL_PHONES.select(soup):
             text = node.get_text(" ", strip=True)
             number = text
             phone_type = None
@@ -213,7 +341,7 @@ class RealtorAgentScraper:
 
     def _parse_office_and_address(self, soup: BeautifulSoup, profile: AgentProfile) -> None:
         # Office info block
-        office_block = soup.select_one("[data-testid='office-info'], .office-info, .brokerage")
+        office_block = _SEL_OFFICE.select_one(soup)
         office: Dict[str, Any] = {}
         if office_block:
             name_el = office_block.find("h2") or office_block.find("h3")
@@ -229,7 +357,7 @@ class RealtorAgentScraper:
                 office["raw_address"] = " ".join(address_text.split())
 
         # Address
-        addr_el = soup.select_one("[data-testid='address'], .agent-address, address")
+        addr_el = _SEL_ADDRESS.select_one(soup)
         if addr_el:
             addr_text = " ".join(addr_el.get_text(" ", strip=True).split())
             profile.address = {"raw": addr_text}
@@ -237,9 +365,14 @@ class RealtorAgentScraper:
         if office:
             profile.office = office
 
-    def _parse_reviews_and_ratings(self, soup: BeautifulSoup, profile: AgentProfile) -> None:
+    def _parse_reviews_and_ratings(
+        self,
+        soup: BeautifulSoup,
+        profile: AgentProfile,
+        markers: Dict[str, NavigableString],
+    ) -> None:
         # Rating score
-        rating_el = soup.select_one("[data-testid='rating'], .rating-value, .review-rating")
+        rating_el = _SEL_RATING.select_one(soup)
         if rating_el:
             rating_text = rating_el.get_text(strip=True)
             try:
@@ -248,7 +381,7 @@ class RealtorAgentScraper:
                 pass
 
         # Review count
-        review_count_el = soup.find(string=lambda s: isinstance(s, str) and "review" in s.lower())
+        review_count_el = markers.get("review_count")
         if review_count_el:
             text = review_count_el.strip()
             digits = "".join(ch for ch in text if ch.isdigit())
@@ -258,9 +391,14 @@ class RealtorAgentScraper:
                 except ValueError:
                     pass
 
-    def _parse_activity_blocks(self, soup: BeautifulSoup, profile: AgentProfile) -> None:
+    def _parse_activity_blocks(
+        self,
+        soup: BeautifulSoup,
+        profile: AgentProfile,
+        markers: Dict[str, NavigableString],
+    ) -> None:
         # Recently sold summary (heuristic)
-        sold_el = soup.find(string=lambda s: isinstance(s, str) and "recently sold" in s.lower())
+        sold_el = markers.get("recently_sold")
         if sold_el:
             text = sold_el.strip()
             digits = "".join(ch for ch in text if ch.isdigit())
@@ -271,7 +409,7 @@ class RealtorAgentScraper:
                     pass
 
         # For sale price range (very heuristic)
-        for_sale_el = soup.find(string=lambda s: isinstance(s, str) and "for sale" in s.lower())
+        for_sale_el = markers.get("for_sale")
         if for_sale_el:
             text = for_sale_el.strip()
             # We just keep raw text; cleaning module can refine this
@@ -280,7 +418,7 @@ class RealtorAgentScraper:
     def _parse_detailed_sections(self, soup: BeautifulSoup, profile: AgentProfile) -> None:
         # Specializations
         specs: List[str] = []
-        for label in soup.select("[data-testid='specialties'] li, .specialties li"):
+        for label in _SEL_SPECIALTIES.select(soup):
             val = label.get_text(strip=True)
             if val:
                 specs.append(val)
@@ -289,9 +427,9 @@ class RealtorAgentScraper:
 
         # Reviews and recommendations listing (simplified)
         reviews: List[Dict[str, Any]] = []
-        for rev_el in soup.select("[data-testid='review'], .review-card"):
-            rating_el = rev_el.select_one(".rating, [data-testid='rating']")
-            comment_el = rev_el.select_one("p, .comment, .review-text")
+        for rev_el in _SEL_REVIEWS.select(soup):
+            rating_el = _SEL_REVIEW_RATING.select_one(rev_el)
+            comment_el = _SEL_REVIEW_COMMENT.select_one(rev_el)
             rating_val: Optional[float] = None
             if rating_el:
                 text = rating_el.get_text(strip=True)
@@ -312,21 +450,13 @@ class RealtorAgentScraper:
     # ------------- URL / link helpers -------------
 
     def _looks_like_agent_profile(self, url: str) -> bool:
-        parsed = urlparse(url.lower())
-        path = parsed.path
-        return "realestateagents" in path or "/agents/" in path
+        # Only the path decides; a host or query string mentioning agents
+        # does not make a listing URL a profile.
+        return _AGENT_URL_RE.search(urlsplit(url).path) is not None
 
     def _extract_agent_links_from_listing(self, soup: BeautifulSoup) -> List[str]:
-        links: List[str] = []
-        candidates = soup.select("a[href*='realestateagents'], a[href*='/agents/']")
-        for a in candidates:
-            href = a.get("href")
-            if not href:
-                continue
-            full_url = urljoin(self.base_url, href)
-            if full_url not in links:
-                links.append(full_url)
-        return links
+        hrefs = (a.get("href") for a in _SEL_AGENT_LINKS.select(soup))
+        return list(dict.fromkeys(urljoin(self.base_url, href) for href in hrefs if href))
 
 def quick_scrape(urls: Iterable[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
     scraper = RealtorAgentScraper()
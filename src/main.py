@@ -3,15 +3,21 @@ import json
 import logging
 import os
 import sys
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 # Make sure local src package imports work even when called from repo root
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
 from extractors.realtor_parser import RealtorAgentScraper  # type: ignore
-from extractors.data_cleaner import clean_agents  # type: ignore
+from extractors.data_cleaner import iter_cleaned_agents  # type: ignore
 from outputs.exporters import export_all  # type: ignore
 
 LOGGER = logging.getLogger("realtor_agents_scraper")
@@ -27,6 +33,10 @@ def load_json_file(path: str) -> Any:
     if not os.path.exists(path):
         raise FileNotFoundError(f"File not found: {path}")
 
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -85,7 +95,14 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         "--formats",
         dest="formats",
         default=None,
-        help="Comma-separated export formats: json,csv,xlsx,xml",
+        help="Comma-separated export formats: json,csv,xlsx,xml,parquet",
+    )
+    parser.add_argument(
+        "--float-precision",
+        dest="float_precision",
+        type=int,
+        default=None,
+        help="Limit float values in CSV/XML exports to this many significant digits.",
     )
     parser.add_argument(
         "--limit",
@@ -122,9 +139,21 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     LOGGER.info("Using export formats: %s", ", ".join(formats))
 
+    float_precision = args.float_precision
+    try:
+        if float_precision is None and settings.get("float_precision") is not None:
+            float_precision = int(settings["float_precision"])
+        if float_precision is not None and float_precision < 1:
+            raise ValueError(f"must be a positive integer, got {float_precision}")
+    except (TypeError, ValueError) as exc:
+        LOGGER.error("Invalid float_precision: %s", exc, exc_info=args.verbose)
+        sys.exit(1)
+
     base_url = settings.get("base_url", "https://www.realtor.com")
     monitoring_mode = bool(settings.get("monitoring_mode", False))
     full_agent_details = bool(settings.get("full_agent_details", False))
+    http_settings = settings.get("http") or {}
+    cache_settings = settings.get("cache") or {}
 
     try:
         urls = load_input_urls(input_file)
@@ -132,37 +161,46 @@ def main(argv: Optional[List[str]] = None) -> None:
         LOGGER.error("Failed to load input URLs: %s", exc, exc_info=args.verbose)
         sys.exit(1)
 
-    scraper = RealtorAgentScraper(
-        base_url=base_url,
-        full_agent_details=full_agent_details,
-        monitoring_mode=monitoring_mode,
-    )
+    try:
+        scraper = RealtorAgentScraper(
+            base_url=base_url,
+            full_agent_details=full_agent_details,
+            monitoring_mode=monitoring_mode,
+            timeout=int(http_settings.get("timeout_seconds", 15)),
+            max_retries=int(http_settings.get("max_retries", 3)),
+            backoff_factor=float(http_settings.get("backoff_factor", 0.8)),
+            workers=int(http_settings.get("workers", 16)),
+            cache_path=cache_settings.get("path") if cache_settings.get("enabled") else None,
+            cache_expire_after=int(cache_settings.get("expire_after_seconds", 3600)),
+        )
+    except Exception as exc:
+        LOGGER.error("Failed to initialize scraper: %s", exc, exc_info=args.verbose)
+        sys.exit(1)
 
+    # Records stream from the scraper through the cleaner into the exporters
+    # without materializing the raw or cleaned lists in between.
     try:
         LOGGER.info("Starting scraping...")
-        raw_agents = scraper.scrape_from_urls(urls=urls, limit=args.limit)
-        LOGGER.info("Scraping complete. Collected %d raw agents.", len(raw_agents))
+        cleaned_agents = iter_cleaned_agents(scraper.iter_agents(urls=urls, limit=args.limit))
+        first_agent = next(cleaned_agents, None)
     except Exception as exc:
         LOGGER.error("Scraping failed: %s", exc, exc_info=args.verbose)
         sys.exit(1)
 
-    if not raw_agents:
+    if first_agent is None:
         LOGGER.warning("No agents were collected. Exiting without export.")
         return
 
     try:
-        LOGGER.info("Cleaning and normalizing agent data...")
-        cleaned_agents = clean_agents(raw_agents)
-        LOGGER.info("Data cleaning complete. %d records ready for export.", len(cleaned_agents))
-    except Exception as exc:
-        LOGGER.error("Data cleaning failed: %s", exc, exc_info=args.verbose)
-        sys.exit(1)
-
-    try:
-        export_all(cleaned_agents, output_dir=output_dir, formats=formats)
+        export_all(
+            chain([first_agent], cleaned_agents),
+            output_dir=output_dir,
+            formats=formats,
+            float_precision=float_precision,
+        )
         LOGGER.info("Export complete. Files written to %s", output_dir)
     except Exception as exc:
-        LOGGER.error("Export failed: %s", exc, exc_info=args.verbose)
+        LOGGER.error("Scraping or export failed: %s", exc, exc_info=args.verbose)
         sys.exit(1)
 
 if __name__ == "__main__":
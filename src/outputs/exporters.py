@@ -2,11 +2,46 @@ import csv
 import json
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, Iterable, List
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape as _xml_escape
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 LOGGER = logging.getLogger("realtor_agents_scraper.exporters")
 
+# Exporters issue many small writes (one per row/field); a 1 MiB buffer
+# keeps the number of write syscalls low on large exports.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_XML_NAME_RE = re.compile(r"[A-Za-z_][\w.-]*")
+# Characters XML 1.0 does not allow in text (control characters, lone
+# surrogates, U+FFFE/U+FFFF); they are dropped from XML cells.
+_XML_INVALID_CHARS_RE = re.compile(
+    "[^\u0009\u000a\u000d\u0020-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+def _dumps(value: Any, indent: bool = False) -> bytes:
+    # orjson serializes straight to UTF-8 bytes; stdlib json is the fallback,
+    # also for values orjson rejects such as integers beyond 64 bits.
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
 def _ensure_output_dir(path: str) -> str:
     os.makedirs(path, exist_ok=True)
     return path
@@ -14,51 +49,121 @@ def _ensure_output_dir(path: str) -> str:
 def _timestamp_suffix() -> str:
     return datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
 
-def export_to_json(agents: Iterable[Dict[str, Any]], output_dir: str) -> str:
-    agents_list = list(agents)
-    _ensure_output_dir(output_dir)
+def _flatten_value(value: Any) -> Optional[str]:
+    # Exact type checks, most common cell types first; only containers pay
+    # for JSON encoding. Missing cells stay None, which csv.writer writes as
+    # an empty field and the XML writer omits.
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is int or value_type is float or value_type is bool:
+        return str(value)
+    if value_type is dict or value_type is list:
+        return _dumps(value).decode("utf-8")
+    return str(value)
 
-    filename = os.path.join(output_dir, f"agents_{_timestamp_suffix()}.json")
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(agents_list, f, ensure_ascii=False, indent=2)
-    LOGGER.info("Exported %d agents to JSON: %s", len(agents_list), filename)
-    return filename
+def _make_flattener(float_precision: Optional[int]) -> Callable[[Any], Optional[str]]:
+    # Floats normally keep Python's shortest round-trip repr. With a precision
+    # set they are cut to that many significant digits, both as scalar cells
+    # and inside JSON-encoded nested values (e.g. review ratings).
+    if float_precision is None:
+        return _flatten_value
+    spec = f".{float_precision}g"
 
-def export_to_csv(agents: Iterable[Dict[str, Any]], output_dir: str) -> str:
-    agents_list = list(agents)
-    _ensure_output_dir(output_dir)
+    def quantize(value: Any) -> Any:
+        value_type = type(value)
+        if value_type is float:
+            return float(format(value, spec))
+        if value_type is dict:
+            return {k: quantize(v) for k, v in value.items()}
+        if value_type is list:
+            return [quantize(v) for v in value]
+        return value
 
-    if not agents_list:
-        raise ValueError("No agents to export to CSV.")
+    def flatten(value: Any) -> Optional[str]:
+        value_type = type(value)
+        if value_type is float:
+            return format(value, spec)
+        if value_type is dict or value_type is list:
+            return _flatten_value(quantize(value))
+        return _flatten_value(value)
 
-    # Collect all top-level keys as columns
-    fieldnames: List[str] = sorted(
-        {key for agent in agents_list for key in agent.keys()}
-    )
+    return flatten
 
-    def flatten_value(value: Any) -> str:
-        if isinstance(value, (dict, list)):
-            return json.dumps(value, ensure_ascii=False)
-        return str(value)
+def _collect_fieldnames(agents_list: List[Dict[str, Any]]) -> List[str]:
+    # Union of top-level keys in first-seen (scrape) order
+    seen: Dict[str, None] = {}
+    for agent in agents_list:
+        if len(agent) <= len(seen) and seen.keys() >= agent.keys():
+            continue
+        for key in agent:
+            if key not in seen:
+                seen[key] = None
+    return list(seen)
 
-    filename = os.path.join(output_dir, f"agents_{_timestamp_suffix()}.csv")
-    with open(filename, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for agent in agents_list:
-            row = {k: flatten_value(agent.get(k)) for k in fieldnames}
-            writer.writerow(row)
+def _check_xml_name(key: str) -> None:
+    if not _XML_NAME_RE.fullmatch(key):
+        raise ValueError(f"Field name {key!r} is not a valid XML element name.")
 
-    LOGGER.info("Exported %d agents to CSV: %s", len(agents_list), filename)
-    return filename
+def _xml_field_tags(key: str) -> Tuple[bytes, bytes]:
+    _check_xml_name(key)
+    return f"    <{key}>".encode("utf-8"), f"</{key}>\n".encode("utf-8")
 
-def export_to_excel(agents: Iterable[Dict[str, Any]], output_dir: str) -> str:
-    agents_list = list(agents)
-    _ensure_output_dir(output_dir)
+def _csv_rows(
+    agents_list: List[Dict[str, Any]],
+    fieldnames: List[str],
+    flatten: Callable[[Any], Optional[str]] = _flatten_value,
+) -> Iterator[List[Optional[str]]]:
+    # Rows are plain lists in column order, fed to csv.writer.writerows in
+    # one call; the flattener is bound as a default to avoid global lookups.
+    for agent in agents_list:
+        get = agent.get
+        yield [flatten(get(k)) for k in fieldnames]
+
+def _export_filename(output_dir: str, extension: str, timestamp: Optional[str]) -> str:
+    return os.path.join(output_dir, f"agents_{timestamp or _timestamp_suffix()}.{extension}")
+
+# The _write_* functions assume the output directory already exists; the
+# public export_to_* wrappers create it, export_all does so once for all.
+
+def _write_json(agents: Iterable[Dict[str, Any]], filename: str) -> None:
+    # The array is written one agent at a time, so the full document never
+    # exists in memory as a single string.
+    count = 0
+    with open(filename, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(b"[")
+        for count, agent in enumerate(agents, start=1):
+            f.write(b"\n" if count == 1 else b",\n")
+            f.write(_dumps(agent, indent=True))
+        f.write(b"\n]\n" if count else b"]\n")
+    LOGGER.info("Exported %d agents to JSON: %s", count, filename)
 
+def _write_csv(
+    agents: Iterable[Dict[str, Any]],
+    filename: str,
+    float_precision: Optional[int] = None,
+) -> None:
+    agents_list = agents if isinstance(agents, list) else list(agents)
     if not agents_list:
-        raise ValueError("No agents to export to Excel.")
+        raise ValueError("No agents to export to CSV.")
+
+    fieldnames = _collect_fieldnames(agents_list)
+    rows = _csv_rows(agents_list, fieldnames, _make_flattener(float_precision))
+    with open(filename, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
+    LOGGER.info("Exported %d agents to CSV: %s", len(agents_list), filename)
 
+def _stringify_nested(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return _dumps(value).decode("utf-8")
+    return value
+
+def _to_dataframe(agents_list: List[Dict[str, Any]]) -> Any:
     try:
         import pandas as pd  # type: ignore
     except ImportError as exc:
@@ -66,61 +171,372 @@ def export_to_excel(agents: Iterable[Dict[str, Any]], output_dir: str) -> str:
             "pandas is required for Excel export. Install it with 'pip install pandas openpyxl'."
         ) from exc
 
-    filename = os.path.join(output_dir, f"agents_{_timestamp_suffix()}.xlsx")
+    # Nested dicts become dotted columns; lists (phones, reviews, ...) are left
+    # by json_normalize and are stored as JSON text like the CSV cells.
     df = pd.json_normalize(agents_list)
-    df.to_excel(filename, index=False)
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].map(_stringify_nested)
+    return df
+
+def _write_xlsx_streaming(df: Any, filename: str) -> bool:
+    try:
+        import xlsxwriter  # type: ignore
+    except ImportError:
+        return False
+
+    # constant_memory flushes each row to disk once the next one starts, so
+    # rows must arrive strictly in order. DataFrame.to_excel emits cells
+    # column by column, which is why rows are written here directly.
+    # strings_to_urls is off so URLs stay plain text like the openpyxl path;
+    # as hyperlinks they would hit Excel's 65,530-per-sheet limit and
+    # xlsxwriter would leave the cells past it empty.
+    workbook = xlsxwriter.Workbook(
+        filename, {"constant_memory": True, "strings_to_urls": False}
+    )
+    try:
+        worksheet = workbook.add_worksheet()
+        write = worksheet.write
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        truncated = 0
+        # write_row stops at a row's first failing cell, so cells are written
+        # one by one and xlsxwriter's error codes are checked here: -1 means
+        # past the sheet's row/column limits, -2 a string cut to 32,767 chars.
+        for row_idx, row in enumerate(chain([[str(c) for c in df.columns]], rows)):
+            for col_idx, value in enumerate(row):
+                error = write(row_idx, col_idx, value)
+                if error == -1:
+                    raise ValueError(
+                        f"Cell at row {row_idx + 1}, column {col_idx + 1} exceeds Excel's worksheet limits."
+                    )
+                if error == -2:
+                    truncated += 1
+        if truncated:
+            LOGGER.warning("Truncated %d Excel cells to 32,767 characters.", truncated)
+    finally:
+        workbook.close()
+    return True
+
+def _write_excel(agents: Iterable[Dict[str, Any]], filename: str) -> None:
+    agents_list = agents if isinstance(agents, list) else list(agents)
+    if not agents_list:
+        raise ValueError("No agents to export to Excel.")
+
+    df = _to_dataframe(agents_list)
+    if not _write_xlsx_streaming(df, filename):
+        df.to_excel(filename, index=False)
     LOGGER.info("Exported %d agents to Excel: %s", len(agents_list), filename)
+
+def _has_empty_struct(pa: Any, arrow_type: Any) -> bool:
+    # Parquet cannot store a struct with no fields, at any nesting depth
+    if pa.types.is_struct(arrow_type):
+        return arrow_type.num_fields == 0 or any(
+            _has_empty_struct(pa, arrow_type.field(i).type) for i in range(arrow_type.num_fields)
+        )
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_empty_struct(pa, arrow_type.value_type)
+    return False
+
+def _parquet_column(pa: Any, values: List[Any]) -> Any:
+    # Columns Arrow cannot type (mixed value types, ints beyond 64 bits) or
+    # Parquet cannot store (empty structs) are written as text cells, with
+    # nested values JSON-encoded like the CSV and Excel exports.
+    try:
+        column = pa.array(values)
+    except (pa.ArrowException, OverflowError):
+        column = None
+    if column is None or _has_empty_struct(pa, column.type):
+        column = pa.array([_flatten_value(value) for value in values], type=pa.string())
+    return column
+
+def _write_parquet(agents: Iterable[Dict[str, Any]], filename: str) -> None:
+    agents_list = agents if isinstance(agents, list) else list(agents)
+    if not agents_list:
+        raise ValueError("No agents to export to Parquet.")
+
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as exc:
+        raise RuntimeError(
+            "pyarrow is required for Parquet export. Install it with 'pip install pyarrow'."
+        ) from exc
+
+    # Built column by column over the union of keys: Table.from_pylist would
+    # take its schema from the first record only and drop later-only fields.
+    # Nested dicts/lists stay typed as Arrow structs/lists.
+    fieldnames = _collect_fieldnames(agents_list)
+    table = pa.Table.from_pydict(
+        {
+            key: _parquet_column(pa, [agent.get(key) for agent in agents_list])
+            for key in fieldnames
+        }
+    )
+    pq.write_table(table, filename, compression="zstd")
+    LOGGER.info("Exported %d agents to Parquet: %s", len(agents_list), filename)
+
+# Each XML record is a sequence of (field name, cell text) pairs
+_XmlRecord = Iterable[Tuple[str, str]]
+
+def _write_xml_lxml(etree: Any, records: Iterable[_XmlRecord], filename: str) -> int:
+    # lxml's incremental writer serializes and escapes in C, streaming each
+    # element to the file without holding a tree. It does not validate tag
+    # names, so each field name is checked the first time it is seen. The
+    # declaration and whitespace match _write_xml_bytes line for line.
+    checked: Dict[str, None] = {}
+    count = 0
+    with open(filename, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(_XML_DECLARATION)
+        with etree.xmlfile(f, encoding="utf-8") as xf:
+            write = xf.write
+            with xf.element("agents"):
+                write("\n")
+                for count, fields in enumerate(records, start=1):
+                    write("  ")
+                    with xf.element("agent"):
+                        write("\n")
+                        for key, text in fields:
+                            if key not in checked:
+                                _check_xml_name(key)
+                                checked[key] = None
+                            write("    ")
+                            with xf.element(key):
+                                write(text)
+                            write("\n")
+                        write("  ")
+                    write("\n")
+        f.write(b"\n")
+    return count
+
+def _write_xml_bytes(records: Iterable[_XmlRecord], filename: str) -> int:
+    # Fallback without lxml: elements are written straight to the file as
+    # bytes. Encoded open/close tags are cached per field name.
+    tags: Dict[str, Tuple[bytes, bytes]] = {}
+    escape = _xml_escape
+    count = 0
+    with open(filename, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        write = f.write
+        write(_XML_DECLARATION)
+        write(b"<agents>\n")
+        for count, fields in enumerate(records, start=1):
+            write(b"  <agent>\n")
+            for key, text in fields:
+                field_tags = tags.get(key)
+                if field_tags is None:
+                    field_tags = tags[key] = _xml_field_tags(key)
+                write(field_tags[0])
+                write(escape(text).encode("utf-8"))
+                write(field_tags[1])
+            write(b"  </agent>\n")
+        write(b"</agents>\n")
+    return count
+
+def _xml_safe_records(records: Iterable[_XmlRecord]) -> Iterator[_XmlRecord]:
+    # One stray control character in a scraped cell would otherwise make lxml
+    # reject the whole file; both backends get the same cleaned text.
+    search = _XML_INVALID_CHARS_RE.search
+    sub = _XML_INVALID_CHARS_RE.sub
+    for fields in records:
+        yield [(key, sub("", text) if search(text) else text) for key, text in fields]
+
+def _write_xml_records(records: Iterable[_XmlRecord], filename: str) -> int:
+    records = _xml_safe_records(records)
+    try:
+        from lxml import etree  # type: ignore
+    except ImportError:
+        return _write_xml_bytes(records, filename)
+    return _write_xml_lxml(etree, records, filename)
+
+def _write_xml(
+    agents: Iterable[Dict[str, Any]],
+    filename: str,
+    float_precision: Optional[int] = None,
+) -> None:
+    flatten = _make_flattener(float_precision)
+    records = (
+        [(key, flatten(value)) for key, value in agent.items() if value is not None]
+        for agent in agents
+    )
+    count = _write_xml_records(records, filename)
+    LOGGER.info("Exported %d agents to XML: %s", count, filename)
+
+def _write_csv_and_xml(
+    agents: Iterable[Dict[str, Any]],
+    csv_filename: str,
+    xml_filename: str,
+    float_precision: Optional[int] = None,
+) -> Dict[str, Exception]:
+    # Single pass for both formats: each record is flattened once, its CSV
+    # row is written and the same cells become its XML element, so memory
+    # stays per record. XML fields follow the CSV column order here.
+    # An XML failure does not stop the CSV: the remaining rows are written
+    # and the error is returned for export_all to report under "xml".
+    agents_list = agents if isinstance(agents, list) else list(agents)
+    if not agents_list:
+        raise ValueError("No agents to export to CSV.")
+
+    fieldnames = _collect_fieldnames(agents_list)
+    rows = _csv_rows(agents_list, fieldnames, _make_flattener(float_precision))
+    failures: Dict[str, Exception] = {}
+    with open(csv_filename, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writerow = writer.writerow
+        csv_errors: List[Exception] = []
+
+        def records() -> Iterator[_XmlRecord]:
+            for row in rows:
+                try:
+                    writerow(row)
+                except Exception as exc:
+                    csv_errors.append(exc)
+                    raise
+                yield [(key, text) for key, text in zip(fieldnames, row) if text is not None]
+
+        try:
+            count = _write_xml_records(records(), xml_filename)
+        except Exception as exc:
+            if csv_errors:
+                raise csv_errors[0]
+            failures["xml"] = exc
+            # Rows already handed to the XML writer are in the CSV; the
+            # generator left off right after them.
+            writer.writerows(rows)
+        else:
+            LOGGER.info("Exported %d agents to XML: %s", count, xml_filename)
+
+    LOGGER.info("Exported %d agents to CSV: %s", len(agents_list), csv_filename)
+    return failures
+
+def export_to_json(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+) -> str:
+    _ensure_output_dir(output_dir)
+    filename = _export_filename(output_dir, "json", timestamp)
+    _write_json(agents, filename)
     return filename
 
-def export_to_xml(agents: Iterable[Dict[str, Any]], output_dir: str) -> str:
-    from xml.etree.ElementTree import Element, SubElement, ElementTree
+def export_to_csv(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    float_precision: Optional[int] = None,
+) -> str:
+    _ensure_output_dir(output_dir)
+    filename = _export_filename(output_dir, "csv", timestamp)
+    _write_csv(agents, filename, float_precision=float_precision)
+    return filename
 
-    agents_list = list(agents)
+def export_to_excel(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+) -> str:
     _ensure_output_dir(output_dir)
+    filename = _export_filename(output_dir, "xlsx", timestamp)
+    _write_excel(agents, filename)
+    return filename
 
-    root = Element("agents")
-    for agent in agents_list:
-        agent_el = SubElement(root, "agent")
-        for key, value in agent.items():
-            if value is None:
-                continue
-            field_el = SubElement(agent_el, key)
-            if isinstance(value, (dict, list)):
-                field_el.text = json.dumps(value, ensure_ascii=False)
-            else:
-                field_el.text = str(value)
-
-    filename = os.path.join(output_dir, f"agents_{_timestamp_suffix()}.xml")
-    tree = ElementTree(root)
-    tree.write(filename, encoding="utf-8", xml_declaration=True)
-    LOGGER.info("Exported %d agents to XML: %s", len(agents_list), filename)
+def export_to_parquet(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+) -> str:
+    _ensure_output_dir(output_dir)
+    filename = _export_filename(output_dir, "parquet", timestamp)
+    _write_parquet(agents, filename)
     return filename
 
-def export_all(agents: Iterable[Dict[str, Any]], output_dir: str, formats: List[str]) -> Dict[str, str]:
+def export_to_xml(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    timestamp: Optional[str] = None,
+    float_precision: Optional[int] = None,
+) -> str:
+    _ensure_output_dir(output_dir)
+    filename = _export_filename(output_dir, "xml", timestamp)
+    _write_xml(agents, filename, float_precision=float_precision)
+    return filename
+
+def export_all(
+    agents: Iterable[Dict[str, Any]],
+    output_dir: str,
+    formats: List[str],
+    float_precision: Optional[int] = None,
+) -> Dict[str, str]:
     formats = [f.lower().strip() for f in formats if f]
     if not formats:
         raise ValueError("No export formats specified.")
 
-    agents_list = list(agents)
+    # Materialized once here; the per-format writers reuse this list as is
+    agents_list = agents if isinstance(agents, list) else list(agents)
     if not agents_list:
         raise ValueError("No agents to export.")
 
-    exported: Dict[str, str] = {}
+    jobs: Dict[str, Callable[..., Optional[Dict[str, Exception]]]] = {}
     for fmt in formats:
-        try:
-            if fmt == "json":
-                exported["json"] = export_to_json(agents_list, output_dir)
-            elif fmt == "csv":
-                exported["csv"] = export_to_csv(agents_list, output_dir)
-            elif fmt in ("xls", "xlsx", "excel"):
-                exported["xlsx"] = export_to_excel(agents_list, output_dir)
-            elif fmt == "xml":
-                exported["xml"] = export_to_xml(agents_list, output_dir)
-            else:
-                LOGGER.warning("Unknown export format '%s'; skipping.", fmt)
-        except Exception as exc:
-            LOGGER.error("Failed to export format '%s': %s", fmt, exc)
+        if fmt == "json":
+            jobs["json"] = _write_json
+        elif fmt == "csv":
+            jobs["csv"] = partial(_write_csv, float_precision=float_precision)
+        elif fmt in ("xls", "xlsx", "excel"):
+            jobs["xlsx"] = _write_excel
+        elif fmt == "xml":
+            jobs["xml"] = partial(_write_xml, float_precision=float_precision)
+        elif fmt == "parquet":
+            jobs["parquet"] = _write_parquet
+        else:
+            LOGGER.warning("Unknown export format '%s'; skipping.", fmt)
+
+    # Directory and timestamp are resolved once for the whole run, so every
+    # format shares the same file stem.
+    _ensure_output_dir(output_dir)
+    timestamp = _timestamp_suffix()
+    requested = list(jobs)
+    filenames = {fmt: _export_filename(output_dir, fmt, timestamp) for fmt in requested}
+
+    # CSV and XML consume the same flattened cells; when both are requested
+    # one job writes both files in a single pass over the records. A job
+    # may return the formats it failed to produce, mapped to their errors.
+    produces = {fmt: (fmt,) for fmt in requested}
+    if "csv" in jobs and "xml" in jobs:
+        del jobs["xml"]
+        jobs["csv"] = partial(
+            _write_csv_and_xml,
+            xml_filename=filenames["xml"],
+            float_precision=float_precision,
+        )
+        produces["csv"] = ("csv", "xml")
+
+    # Each format writes its own file from the same read-only list. The
+    # encoding work is GIL-bound Python, so the threads only let one
+    # format's file writes overlap with another's encoding; they do not
+    # run the formats' CPU work in parallel.
+    succeeded = set()
+    if jobs:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                executor.submit(writer, agents_list, filenames[fmt]): fmt
+                for fmt, writer in jobs.items()
+            }
+            for future in as_completed(futures):
+                fmt = futures[future]
+                try:
+                    failures = future.result() or {}
+                except Exception as exc:
+                    failures = {out_fmt: exc for out_fmt in produces[fmt]}
+                for out_fmt in produces[fmt]:
+                    if out_fmt not in failures:
+                        succeeded.add(out_fmt)
+                        continue
+                    LOGGER.error("Failed to export format '%s': %s", out_fmt, failures[out_fmt])
+                    # Do not leave a truncated file next to the good ones
+                    if os.path.exists(filenames[out_fmt]):
+                        os.remove(filenames[out_fmt])
 
+    exported = {fmt: filenames[fmt] for fmt in requested if fmt in succeeded}
     if not exported:
         raise RuntimeError("No exports were successfully generated.")
-    return exported
\ No newline at end of file
+    return exported